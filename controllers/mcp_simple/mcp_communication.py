@@ -31,8 +31,8 @@ class MCPCommunication:
         # Initialize communication files
         self.initialize_files()
         
-        logger.info(f"MCPCommunication initialized for {robot_name}")
-        logger.info(f"Data directory: {self.data_dir}")
+        logger.info("MCPCommunication initialized for %s", robot_name)
+        logger.info("Data directory: %s", self.data_dir)
         
     def initialize_files(self):
         """Initialize communication files with default values"""
@@ -74,7 +74,7 @@ class MCPCommunication:
             logger.info("Communication files initialized successfully")
             
         except Exception as e:
-            logger.error(f"Error initializing files: {e}")
+            logger.error("Error initializing files: %s", e)
     
     def get_new_command(self):
         """Check for new commands from MCP server"""
@@ -117,12 +117,12 @@ class MCPCommunication:
                 logger.debug("Removed old command file")
                 
         except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error in command file: {e}")
+            logger.error("JSON decode error in command file: %s", e)
             # Remove corrupted file
             if self.commands_file.exists():
                 self.commands_file.unlink()
         except Exception as e:
-            logger.error(f"Error reading command: {e}")
+            logger.error("Error reading command: %s", e)
             
         return None
     
@@ -138,7 +138,7 @@ class MCPCommunication:
             required_fields = ['timestamp', 'webots_connected', 'flight_status', 'position']
             for field in required_fields:
                 if field not in status_data:
-                    logger.warning(f"Missing required field in status: {field}")
+                    logger.warning("Missing required field in status: %s", field)
             
             # Add timestamp
             status_data['last_update'] = time.time()
@@ -155,7 +155,7 @@ class MCPCommunication:
             return True
             
         except Exception as e:
-            logger.error(f"Error saving status: {e}")
+            logger.error("Error saving status: %s", e)
             # Clean up temporary file if it exists
             temp_file = self.status_file.with_suffix('.tmp')
             if temp_file.exists():
@@ -177,11 +177,11 @@ class MCPCommunication:
             # Atomic rename
             temp_file.rename(self.image_file)
             
-            logger.info(f"Image saved successfully: {self.image_file}")
+            logger.info("Image saved successfully: %s", self.image_file)
             return True
             
         except Exception as e:
-            logger.error(f"Error saving image: {e}")
+            logger.error("Error saving image: %s", e)
             # Clean up temporary file if it exists
             temp_file = self.image_file.with_suffix('.tmp')
             if temp_file.exists():
@@ -246,12 +246,12 @@ class MCPCommunication:
             for file_path in files_to_clean:
                 if file_path.exists():
                     file_path.unlink()
-                    logger.info(f"Cleaned up: {file_path}")
+                    logger.info("Cleaned up: %s", file_path)
             
             logger.info("Communication cleanup completed")
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
 # Command validation helpers
 def validate_position_data(position):
@@ -9,13 +9,15 @@ Based on the existing enhanced Crazyflie controller and documentation.
 """
 
 from controller import Robot, Motor, DistanceSensor, InertialUnit, GPS, Gyro, Camera
-import json
 import time
 import math
 import os
 from pathlib import Path
 import logging
 
+# File-based MCP communication (shared with the rest of the package)
+from mcp_communication import MCPCommunication
+
 # Import existing flight components
 import sys
 sys.path.append(str(Path(__file__).parent.parent / "old" / "project-crazyflie" / "controllers"))
@@ -30,84 +32,6 @@ except ImportError:
     BasicDroneActions = None
     CollisionAvoidanceSystem = None
 
-class MCPCommunication:
-    """Handles file-based communication with MCP server"""
-    
-    def __init__(self, robot_name: str):
-        self.robot_name = robot_name
-        self.data_dir = Path(__file__).parent.parent / "data" / robot_name
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.commands_file = self.data_dir / "commands.json"
-        self.status_file = self.data_dir / "status.json"
-        self.image_file = self.data_dir / "camera_image.jpg"
-        
-        # Initialize empty files
-        self.last_command_timestamp = 0
-        self.initialize_files()
-        
-    def initialize_files(self):
-        """Initialize communication files"""
-        # Initialize status file
-        initial_status = {
-            "timestamp": time.time(),
-            "webots_connected": True,
-            "flight_status": "idle",
-            "position": {"x": 0.0, "y": 0.0, "z": 0.0, "roll": 0.0, "pitch": 0.0, "yaw": 0.0},
-            "collision_sensors": {},
-            "current_action": "initializing",
-            "action_progress": 0.0,
-            "last_update": time.time(),
-            "last_image_timestamp": 0,
-            "system_health": "OK"
-        }
-        self.save_status(initial_status)
-        
-        # Clear any existing commands
-        if self.commands_file.exists():
-            self.commands_file.unlink()
-    
-    def get_new_command(self):
-        """Check for new commands from MCP server"""
-        try:
-            if not self.commands_file.exists():
-                return None
-                
-            with open(self.commands_file, 'r') as f:
-                command = json.load(f)
-                
-            # Check if this is a new command
-            command_timestamp = command.get('timestamp', 0)
-            if command_timestamp > self.last_command_timestamp:
-                self.last_command_timestamp = command_timestamp
-                # Remove the command file after reading
-                self.commands_file.unlink()
-                return command
-                
-        except Exception as e:
-            logging.error(f"Error reading command: {e}")
-            
-        return None
-    
-    def save_status(self, status_data):
-        """Save current status to file"""
-        try:
-            status_data['last_update'] = time.time()
-            with open(self.status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
-        except Exception as e:
-            logging.error(f"Error saving status: {e}")
-    
-    def save_image(self, image_data):
-        """Save camera image to file"""
-        try:
-            with open(self.image_file, 'wb') as f:
-                f.write(image_data)
-            return True
-        except Exception as e:
-            logging.error(f"Error saving image: {e}")
-            return False
-
 class SimplifiedFlightController:
     """Simplified flight controller for basic operations"""
     
@@ -377,20 +301,20 @@ class SimpleMCPController:
                 print(f"[CONTROLLER] ✈️ Executing takeoff to altitude: {altitude}m")
                 result = self.flight_controller.takeoff(altitude)
                 self.current_action = "takeoff"
-                self.action_start_time = time.time()
+                self.action_start_time = time.monotonic()
                 print(f"[CONTROLLER] ✅ Takeoff command executed: {result}")
                 
             elif action == "land":
                 print(f"[CONTROLLER] 🛬 Executing landing")
                 result = self.flight_controller.land()
                 self.current_action = "landing"
-                self.action_start_time = time.time()
+                self.action_start_time = time.monotonic()
                 
             elif action == "hover":
                 duration = command.get('duration', 5.0)
                 result = self.flight_controller.hover(duration)
                 self.current_action = "hovering"
-                self.action_start_time = time.time()
+                self.action_start_time = time.monotonic()
                 
             elif action == "move_relative":
                 forward = command.get('forward', 0.0)
@@ -401,18 +325,18 @@ class SimpleMCPController:
                 
                 result = self.flight_controller.move_relative(forward, sideways, up, yaw, duration)
                 self.current_action = "moving"
-                self.action_start_time = time.time()
+                self.action_start_time = time.monotonic()
                 
             elif action == "set_altitude":
                 altitude = command.get('altitude', 1.0)
                 result = self.flight_controller.set_altitude(altitude)
                 self.current_action = "altitude_adjustment"
-                self.action_start_time = time.time()
+                self.action_start_time = time.monotonic()
                 
             elif action == "emergency_stop":
                 result = self.flight_controller.emergency_stop()
                 self.current_action = "emergency_stop"
-                self.action_start_time = time.time()
+                self.action_start_time = time.monotonic()
                 
             elif action == "get_camera_image":
                 result = self.capture_camera_image()
@@ -471,7 +395,7 @@ class SimpleMCPController:
         
         # Calculate action progress (simplified)
         if self.action_start_time > 0:
-            elapsed = time.time() - self.action_start_time
+            elapsed = time.monotonic() - self.action_start_time
             if elapsed < 5.0:  # Assume 5 seconds for most actions
                 self.action_progress = min(1.0, elapsed / 5.0)
             else:
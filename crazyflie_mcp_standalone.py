@@ -9,56 +9,98 @@ This version can run independently without complex MCP framework
 for testing and development purposes.
 """
 
-import asyncio
+import atexit
+import functools
 import json
 import os
+import queue
+import shlex
+import signal
 import sys
+import tempfile
 import time
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    # Without inotify (non-Linux), the wait helpers fall back to polling
+    INotify = None
+    inotify_flags = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import readline  # enables line editing and history for input()
+except ImportError:
+    readline = None
+
 # Create necessary directories
 os.makedirs('logs', exist_ok=True)
 os.makedirs('data', exist_ok=True)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/crazyflie_mcp.log'),
-    ]
-)
+# Configure logging: the console is written synchronously so log lines stay
+# ordered with REPL output; file records are only enqueued, and a listener
+# thread formats and writes them so tool calls never block on disk
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_log_formatter)
+_file_handler = logging.handlers.RotatingFileHandler('logs/crazyflie_mcp.log', maxBytes=10_000_000, backupCount=3)
+_file_handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(_console_handler)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
-# Configuration
-ROOT_DATA_DIR = Path(__file__).parent / "data"
-LOGS_DIR = Path(__file__).parent / "logs"
+# Configuration (resolved once, so derived paths are absolute without per-call resolve())
+BASE_DIR = Path(__file__).resolve().parent
+ROOT_DATA_DIR = BASE_DIR / "data"
+LOGS_DIR = BASE_DIR / "logs"
+READY_FLAG = ROOT_DATA_DIR / "ready.flag"
+
+# mkstemp creates files as 0600; published command files get the usual
+# umask-derived mode so a controller running as another user can read them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+COMMAND_FILE_MODE = 0o666 & ~_UMASK
 
 # Create necessary directories
 ROOT_DATA_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
 
+@functools.lru_cache(maxsize=32)
 def get_robot_data_dir(drone_name: str) -> Path:
     """Returns the data directory for a given drone."""
     return ROOT_DATA_DIR / drone_name
 
+@functools.lru_cache(maxsize=32)
 def get_commands_file(drone_name: str) -> Path:
     """Returns the commands file path for a given drone."""
     return get_robot_data_dir(drone_name) / "commands.json"
 
+@functools.lru_cache(maxsize=32)
 def get_status_file(drone_name: str) -> Path:
     """Returns the status file path for a given drone."""
     return get_robot_data_dir(drone_name) / "status.json"
 
+@functools.lru_cache(maxsize=32)
 def get_image_file(drone_name: str) -> Path:
     """Returns the camera image file path for a given drone."""
     return get_robot_data_dir(drone_name) / "camera_image.jpg"
 
-# Global state
-drone_status = {
+# Last known status per drone, seeded from these defaults until a file is loaded
+_DEFAULT_STATUS = {
     "running": False,
     "webots_connected": False,
     "flight_status": "idle",  # idle, takeoff, hovering, landing, moving, emergency
@@ -70,20 +112,86 @@ drone_status = {
     "last_image_timestamp": 0,
     "system_health": "OK"
 }
+drone_states: Dict[str, Dict[str, Any]] = {}
+
+def get_drone_state(drone_name: str) -> Dict[str, Any]:
+    """Returns the last known status dict for a given drone."""
+    state = drone_states.get(drone_name)
+    if state is None:
+        state = drone_states[drone_name] = dict(_DEFAULT_STATUS)
+    return state
+
+def _dumps(data: Any) -> str:
+    """Serialize a tool response as compact JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def _dumps_bytes(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes for the controller files."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The controller's json.dump emits NaN/Infinity for non-finite
+            # sensor readings, which orjson rejects; the stdlib accepts them
+            pass
+    return json.loads(data)
+
+# A file's identity for change detection. mtime alone is too coarse (about one
+# kernel tick) when the controller publishes several times per tick in fast
+# mode; it publishes by rename, so each write also gets a new inode.
+_MISSING_FILE = (0, 0, 0)
+
+def _file_signature(path: Path) -> tuple:
+    """Return (st_ino, st_size, st_mtime_ns) of path, or _MISSING_FILE if absent."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return _MISSING_FILE
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+# When each drone's status was last checked: name -> (checked_at, signature).
+# Internal sweeps trust a check younger than the TTL; tool calls pass
+# max_age=0, and an unchanged file then costs a stat() instead of a parse.
+STATUS_CACHE_TTL = 0.1
+_STATUS_CACHE: Dict[str, tuple] = {}
+
+def load_status(drone_name: str, max_age: float = STATUS_CACHE_TTL) -> bool:
+    """Load drone status from file into its entry in drone_states.
+
+    A status checked within the last `max_age` seconds is reused without
+    touching the disk; `max_age=0` always checks the file (one stat when unchanged).
+    """
+    now = time.monotonic()
+    hit = _STATUS_CACHE.get(drone_name)
+    if hit and now - hit[0] < max_age:
+        return True
 
-def load_status(drone_name: str) -> bool:
-    """Load drone status from file."""
-    global drone_status
     status_file = get_status_file(drone_name)
     try:
-        if status_file.exists():
-            with open(status_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                drone_status.update(data)
-                logger.debug(f"Status for {drone_name} loaded successfully.")
-                return True
+        signature = _file_signature(status_file)
+        if signature == _MISSING_FILE:
+            return False
+        if hit and hit[1] == signature:
+            _STATUS_CACHE[drone_name] = (now, signature)
+            return True
+        # One binary read handed straight to the decoder (no text-mode layer)
+        data = _loads(status_file.read_bytes())
+        get_drone_state(drone_name).update(data)
+        _STATUS_CACHE[drone_name] = (now, signature)
+        logger.debug("Status for %s loaded successfully.", drone_name)
+        return True
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        logger.error(f"Error loading status for {drone_name}: {e}")
+        logger.error("Error loading status for %s: %s", drone_name, e)
     return False
 
 def save_command(drone_name: str, command: dict) -> bool:
@@ -91,39 +199,90 @@ def save_command(drone_name: str, command: dict) -> bool:
     commands_file = get_commands_file(drone_name)
     try:
         command['timestamp'] = time.time()
-        # Ensure directory exists
-        commands_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(commands_file, 'w', encoding='utf-8') as f:
-            json.dump(command, f, indent=2, ensure_ascii=False)
-        logger.info(f"Command '{command.get('action')}' for {drone_name} saved to {commands_file}")
+        # Compact, single-write payload: the controller is the only reader
+        payload = _dumps_bytes(command)
+        # Write to a uniquely named temporary file, then rename (atomic
+        # operation) so the controller never reads a half-written command and
+        # concurrent writers never share a temp file
+        try:
+            fd, temp_name = tempfile.mkstemp(dir=commands_file.parent, prefix='commands.', suffix='.tmp')
+        except FileNotFoundError:
+            # First command for this drone: create its data directory once
+            commands_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=commands_file.parent, prefix='commands.', suffix='.tmp')
+        try:
+            try:
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(fd, COMMAND_FILE_MODE)
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(temp_name, commands_file)
+        except OSError:
+            # Don't leave a stray temp file next to the command file
+            os.unlink(temp_name)
+            raise
+        logger.debug("Command '%s' for %s saved to %s", command.get('action'), drone_name, commands_file)
         return True
     except Exception as e:
-        logger.error(f"Error saving command for {drone_name}: {e}")
+        logger.error("Error saving command for %s: %s", drone_name, e)
         return False
 
-def wait_for_status_update(drone_name: str, timeout: float = 5.0) -> bool:
-    """Wait for status update from controller."""
-    start_time = time.time()
-    initial_update_time = drone_status.get('last_update', 0)
-    
-    while time.time() - start_time < timeout:
-        load_status(drone_name)
-        if drone_status.get('last_update', 0) > initial_update_time:
-            return True
-        time.sleep(0.1)
-    return False
+def _file_rewritten(path: Path, since: tuple) -> bool:
+    """True if path exists and its signature differs from `since`."""
+    signature = _file_signature(path)
+    return signature != since and signature != _MISSING_FILE
 
-def wait_for_image_update(drone_name: str, timeout: float = 10.0) -> bool:
-    """Wait for image update from controller."""
-    start_time = time.time()
-    initial_image_time = drone_status.get('last_image_timestamp', 0)
+def _wait_for_file_write(drone_name: str, path: Path, since: tuple, timeout: float) -> bool:
+    """Block until the controller rewrites `path` (its signature differs from `since`)."""
+    deadline = time.monotonic() + timeout
+    if INotify is not None:
+        try:
+            with INotify() as inotify:
+                # Controller writes either in place (CLOSE_WRITE) or via rename (MOVED_TO)
+                inotify.add_watch(path.parent, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+                # Catch a write that landed before the watch was armed
+                if _file_rewritten(path, since):
+                    return True
+                while (remaining := deadline - time.monotonic()) > 0:
+                    for event in inotify.read(timeout=int(remaining * 1000)):
+                        if event.name == path.name:
+                            return True
+                return False
+        except OSError as e:
+            # Data directory missing or watch limit reached; poll instead
+            logger.debug("inotify unavailable for %s, polling: %s", drone_name, e)
     
-    while time.time() - start_time < timeout:
-        load_status(drone_name)
-        if drone_status.get('last_image_timestamp', 0) > initial_image_time:
+    while True:
+        if _file_rewritten(path, since):
             return True
+        if time.monotonic() >= deadline:
+            return False
         time.sleep(0.1)
-    return False
+
+def wait_for_status_update(drone_name: str, timeout: float = 5.0,
+                           since: Optional[tuple] = None) -> bool:
+    """Wait for status update from controller."""
+    status_file = get_status_file(drone_name)
+    if since is None:
+        since = _file_signature(status_file)
+    return _wait_for_file_write(drone_name, status_file, since, timeout)
+
+def wait_for_image_update(drone_name: str, timeout: float = 10.0,
+                          since: Optional[tuple] = None) -> bool:
+    """Wait for image update from controller.
+
+    Pass `since` (the image's _file_signature sampled before sending the camera
+    command) so an image published before the wait starts is not missed.
+    """
+    image_file = get_image_file(drone_name)
+    if since is None:
+        since = _file_signature(image_file)
+    return _wait_for_file_write(drone_name, image_file, since, timeout)
+
+def _clamp(value: float, low: float, high: float) -> float:
+    """Limit value to [low, high] with plain comparisons (no builtin calls)."""
+    return low if value < low else high if value > high else value
 
 # ========================================
 # FLIGHT CONTROL TOOLS (5 tools)
@@ -131,10 +290,10 @@ def wait_for_image_update(drone_name: str, timeout: float = 10.0) -> bool:
 
 def takeoff(drone_name: str, altitude: float = 1.0) -> str:
     """Execute basic takeoff sequence to specified altitude."""
-    logger.info(f"Takeoff command for {drone_name} to altitude {altitude}m")
+    logger.info("Takeoff command for %s to altitude %sm", drone_name, altitude)
     
     # Validate altitude
-    altitude = max(0.1, min(10.0, altitude))
+    altitude = _clamp(altitude, 0.1, 10.0)
     
     command = {
         "action": "takeoff",
@@ -148,7 +307,7 @@ def takeoff(drone_name: str, altitude: float = 1.0) -> str:
 
 def land(drone_name: str) -> str:
     """Execute controlled landing sequence."""
-    logger.info(f"Landing command for {drone_name}")
+    logger.info("Landing command for %s", drone_name)
     
     command = {
         "action": "land"
@@ -161,7 +320,7 @@ def land(drone_name: str) -> str:
 
 def hover(drone_name: str, duration: float = 5.0) -> str:
     """Maintain stable hovering position for specified duration."""
-    logger.info(f"Hover command for {drone_name} for {duration}s")
+    logger.info("Hover command for %s for %ss", drone_name, duration)
     
     command = {
         "action": "hover",
@@ -178,14 +337,14 @@ def hover(drone_name: str, duration: float = 5.0) -> str:
 
 def move_relative(drone_name: str, forward: float, sideways: float, up: float, yaw: float, duration: float = 2.0) -> str:
     """Execute relative movement in multiple axes."""
-    logger.info(f"Relative movement for {drone_name}: forward={forward}, sideways={sideways}, up={up}, yaw={yaw}, duration={duration}")
+    logger.info("Relative movement for %s: forward=%s, sideways=%s, up=%s, yaw=%s, duration=%s", drone_name, forward, sideways, up, yaw, duration)
     
     # Limit movement ranges for safety
-    forward = max(-5.0, min(5.0, forward))
-    sideways = max(-5.0, min(5.0, sideways))
-    up = max(-3.0, min(3.0, up))
-    yaw = max(-3.14, min(3.14, yaw))
-    duration = max(0.5, min(30.0, duration))
+    forward = _clamp(forward, -5.0, 5.0)
+    sideways = _clamp(sideways, -5.0, 5.0)
+    up = _clamp(up, -3.0, 3.0)
+    yaw = _clamp(yaw, -3.14, 3.14)
+    duration = _clamp(duration, 0.5, 30.0)
     
     command = {
         "action": "move_relative",
@@ -203,7 +362,7 @@ def move_relative(drone_name: str, forward: float, sideways: float, up: float, y
 
 def emergency_stop(drone_name: str) -> str:
     """Execute immediate emergency stop with motor cutoff."""
-    logger.warning(f"EMERGENCY STOP command for {drone_name}")
+    logger.warning("EMERGENCY STOP command for %s", drone_name)
     
     command = {
         "action": "emergency_stop"
@@ -220,87 +379,97 @@ def emergency_stop(drone_name: str) -> str:
 
 def get_drone_position(drone_name: str) -> str:
     """Get current drone position, orientation, and velocity."""
-    logger.info(f"Position request for {drone_name}")
-    load_status(drone_name)
+    logger.info("Position request for %s", drone_name)
+    load_status(drone_name, max_age=0)
+    status = get_drone_state(drone_name)
     
     position_data = {
-        "position": drone_status.get('position', {"x": 0.0, "y": 0.0, "z": 0.0}),
+        "position": status.get('position', {"x": 0.0, "y": 0.0, "z": 0.0}),
         "orientation": {
-            "roll": drone_status.get('position', {}).get('roll', 0.0),
-            "pitch": drone_status.get('position', {}).get('pitch', 0.0),
-            "yaw": drone_status.get('position', {}).get('yaw', 0.0)
+            "roll": status.get('position', {}).get('roll', 0.0),
+            "pitch": status.get('position', {}).get('pitch', 0.0),
+            "yaw": status.get('position', {}).get('yaw', 0.0)
         },
-        "timestamp": drone_status.get('last_update', 0)
+        "timestamp": status.get('last_update', 0)
     }
     
-    return json.dumps(position_data, indent=2)
+    return _dumps(position_data)
 
 def get_drone_status(drone_name: str) -> str:
     """Get comprehensive drone status including flight state and system health."""
-    logger.info(f"Status request for {drone_name}")
-    load_status(drone_name)
+    logger.info("Status request for %s", drone_name)
+    load_status(drone_name, max_age=0)
+    status = get_drone_state(drone_name)
     
     # Check if controller is active (updated within last 10 seconds)
     current_time = time.time()
-    last_update = drone_status.get('last_update', 0)
+    last_update = status.get('last_update', 0)
     is_running = (current_time - last_update) < 10.0
     
     status_data = {
         "running": is_running,
-        "webots_connected": drone_status.get('webots_connected', False),
-        "flight_status": drone_status.get('flight_status', 'idle'),
-        "position": drone_status.get('position', {"x": 0.0, "y": 0.0, "z": 0.0}),
-        "current_action": drone_status.get('current_action', 'none'),
-        "action_progress": drone_status.get('action_progress', 0.0),
-        "system_health": drone_status.get('system_health', 'OK'),
+        "webots_connected": status.get('webots_connected', False),
+        "flight_status": status.get('flight_status', 'idle'),
+        "position": status.get('position', {"x": 0.0, "y": 0.0, "z": 0.0}),
+        "current_action": status.get('current_action', 'none'),
+        "action_progress": status.get('action_progress', 0.0),
+        "system_health": status.get('system_health', 'OK'),
         "last_update": last_update,
         "time_since_update": current_time - last_update
     }
     
-    return json.dumps(status_data, indent=2)
+    return _dumps(status_data)
 
 def get_visual_perception(drone_name: str) -> str:
     """Capture image from drone's camera for analysis."""
-    logger.info(f"Visual perception request for {drone_name}")
+    logger.info("Visual perception request for %s", drone_name)
     
     command = {
         "action": "get_camera_image"
     }
     
+    image_path = get_image_file(drone_name)
+    image_signature = _file_signature(image_path)
+    
     if not save_command(drone_name, command):
         return f"❌ Error sending camera command for {drone_name}"
     
-    if not wait_for_image_update(drone_name):
+    if not wait_for_image_update(drone_name, since=image_signature):
         return f"⚠️ Camera command sent for {drone_name}, but image not received within timeout"
     
-    image_path = get_image_file(drone_name)
-    if not image_path.exists():
+    try:
+        os.stat(image_path)
+    except FileNotFoundError:
         return f"❌ Image file for {drone_name} not found after update"
     
-    return f"✅ Image captured for {drone_name}: {image_path.resolve()}"
+    return f"✅ Image captured for {drone_name}: {image_path}"
+
+# Response when the controller has not reported any collision data yet
+_NO_COLLISION_DATA_JSON = _dumps({
+    "range_north": 999.0,
+    "range_northeast": 999.0,
+    "range_east": 999.0,
+    "range_southeast": 999.0,
+    "range_south": 999.0,
+    "range_southwest": 999.0,
+    "range_west": 999.0,
+    "range_northwest": 999.0,
+    "risk_level": "UNKNOWN"
+})
 
 def get_collision_sensors(drone_name: str) -> str:
     """Get readings from 8-directional collision sensors."""
-    logger.info(f"Collision sensor request for {drone_name}")
-    load_status(drone_name)
+    logger.info("Collision sensor request for %s", drone_name)
+    load_status(drone_name, max_age=0)
+    status = get_drone_state(drone_name)
     
-    collision_data = drone_status.get('collision_sensors', {})
+    collision_data = status.get('collision_sensors', {})
     
     # If no collision data, return empty structure
     if not collision_data:
-        collision_data = {
-            "range_north": 999.0,
-            "range_northeast": 999.0,
-            "range_east": 999.0,
-            "range_southeast": 999.0,
-            "range_south": 999.0,
-            "range_southwest": 999.0,
-            "range_west": 999.0,
-            "range_northwest": 999.0,
-            "risk_level": "UNKNOWN"
-        }
+        return _NO_COLLISION_DATA_JSON
     
-    return json.dumps(collision_data, indent=2)
+    return _dumps(collision_data)
 
 # ========================================
 # SYSTEM CONTROL TOOLS (2 tools)
@@ -308,10 +477,10 @@ def get_collision_sensors(drone_name: str) -> str:
 
 def set_altitude(drone_name: str, altitude: float) -> str:
     """Set and maintain specific altitude."""
-    logger.info(f"Set altitude command for {drone_name} to {altitude}m")
+    logger.info("Set altitude command for %s to %sm", drone_name, altitude)
     
     # Validate altitude
-    altitude = max(0.1, min(10.0, altitude))
+    altitude = _clamp(altitude, 0.1, 10.0)
     
     command = {
         "action": "set_altitude",
@@ -325,129 +494,136 @@ def set_altitude(drone_name: str, altitude: float) -> str:
 
 def check_drone_connection(drone_name: str) -> str:
     """Perform health check and verify drone connection status."""
-    logger.info(f"Connection check for {drone_name}")
-    load_status(drone_name)
+    logger.info("Connection check for %s", drone_name)
+    load_status(drone_name, max_age=0)
+    status = get_drone_state(drone_name)
     
     current_time = time.time()
-    last_update = drone_status.get('last_update', 0)
+    last_update = status.get('last_update', 0)
     time_since_update = current_time - last_update
     is_connected = time_since_update < 10.0
     
+    # One directory scan instead of a stat() per communication file
+    try:
+        with os.scandir(get_robot_data_dir(drone_name)) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        names = set()
+    
     connection_info = {
         "connected": is_connected,
-        "webots_connected": drone_status.get('webots_connected', False),
+        "webots_connected": status.get('webots_connected', False),
         "last_update": last_update,
         "time_since_update": time_since_update,
-        "system_health": drone_status.get('system_health', 'UNKNOWN'),
-        "flight_status": drone_status.get('flight_status', 'unknown'),
-        "commands_file_exists": get_commands_file(drone_name).exists(),
-        "status_file_exists": get_status_file(drone_name).exists(),
+        "system_health": status.get('system_health', 'UNKNOWN'),
+        "flight_status": status.get('flight_status', 'unknown'),
+        "commands_file_exists": get_commands_file(drone_name).name in names,
+        "status_file_exists": get_status_file(drone_name).name in names,
         "data_directory": str(get_robot_data_dir(drone_name))
     }
     
-    return json.dumps(connection_info, indent=2)
+    return _dumps(connection_info)
 
 # ========================================
 # UTILITY TOOLS
 # ========================================
 
-def get_crazyflie_capabilities() -> str:
-    """Get detailed list of all available Crazyflie MCP tools and capabilities."""
-    logger.info("Capabilities request")
-    
-    capabilities = {
-        "server_info": {
-            "name": "Crazyflie Webots MCP Server",
-            "version": "1.0.0",
-            "description": "Standalone server for Crazyflie drone control in Webots",
-            "architecture": "File-based communication with 11 essential tools"
+_CAPABILITIES = {
+    "server_info": {
+        "name": "Crazyflie Webots MCP Server",
+        "version": "1.0.0",
+        "description": "Standalone server for Crazyflie drone control in Webots",
+        "architecture": "File-based communication with 11 essential tools"
+    },
+    "flight_control": {
+        "takeoff": {
+            "description": "Execute basic takeoff sequence",
+            "parameters": ["drone_name", "altitude (optional, default: 1.0)"]
         },
-        "flight_control": {
-            "takeoff": {
-                "description": "Execute basic takeoff sequence",
-                "parameters": ["drone_name", "altitude (optional, default: 1.0)"]
-            },
-            "land": {
-                "description": "Execute controlled landing sequence",
-                "parameters": ["drone_name"]
-            },
-            "hover": {
-                "description": "Maintain stable hovering position",
-                "parameters": ["drone_name", "duration (optional, default: 5.0)"]
-            },
-            "move_relative": {
-                "description": "Relative movement in multiple axes",
-                "parameters": ["drone_name", "forward", "sideways", "up", "yaw", "duration (optional)"]
-            },
-            "emergency_stop": {
-                "description": "Immediate emergency stop with motor cutoff",
-                "parameters": ["drone_name"]
-            }
+        "land": {
+            "description": "Execute controlled landing sequence",
+            "parameters": ["drone_name"]
         },
-        "sensing_status": {
-            "get_drone_position": {
-                "description": "Get current position and orientation",
-                "parameters": ["drone_name"]
-            },
-            "get_drone_status": {
-                "description": "Get comprehensive flight status",
-                "parameters": ["drone_name"]
-            },
-            "get_visual_perception": {
-                "description": "Capture camera image for analysis",
-                "parameters": ["drone_name"]
-            },
-            "get_collision_sensors": {
-                "description": "Get 8-directional collision sensor readings",
-                "parameters": ["drone_name"]
-            }
+        "hover": {
+            "description": "Maintain stable hovering position",
+            "parameters": ["drone_name", "duration (optional, default: 5.0)"]
         },
-        "system_control": {
-            "set_altitude": {
-                "description": "Set and maintain specific altitude",
-                "parameters": ["drone_name", "altitude"]
-            },
-            "check_drone_connection": {
-                "description": "Health check and connection verification",
-                "parameters": ["drone_name"]
-            }
+        "move_relative": {
+            "description": "Relative movement in multiple axes",
+            "parameters": ["drone_name", "forward", "sideways", "up", "yaw", "duration (optional)"]
+        },
+        "emergency_stop": {
+            "description": "Immediate emergency stop with motor cutoff",
+            "parameters": ["drone_name"]
+        }
+    },
+    "sensing_status": {
+        "get_drone_position": {
+            "description": "Get current position and orientation",
+            "parameters": ["drone_name"]
+        },
+        "get_drone_status": {
+            "description": "Get comprehensive flight status",
+            "parameters": ["drone_name"]
+        },
+        "get_visual_perception": {
+            "description": "Capture camera image for analysis",
+            "parameters": ["drone_name"]
+        },
+        "get_collision_sensors": {
+            "description": "Get 8-directional collision sensor readings",
+            "parameters": ["drone_name"]
+        }
+    },
+    "system_control": {
+        "set_altitude": {
+            "description": "Set and maintain specific altitude",
+            "parameters": ["drone_name", "altitude"]
+        },
+        "check_drone_connection": {
+            "description": "Health check and connection verification",
+            "parameters": ["drone_name"]
         }
     }
-    
-    return json.dumps(capabilities, indent=2)
+}
+
+# Static payload: serialized once at import instead of on every request
+_CAPABILITIES_JSON = _dumps(_CAPABILITIES)
+
+def get_crazyflie_capabilities() -> str:
+    """Get detailed list of all available Crazyflie MCP tools and capabilities."""
+    logger.info("Capabilities request")
+    return _CAPABILITIES_JSON
 
 def list_active_drones() -> List[Dict[str, Any]]:
     """List all active drones with their current status."""
     logger.info("Active drones list requested")
     
-    if not ROOT_DATA_DIR.is_dir():
+    try:
+        # DirEntry.is_dir() uses the type from the directory listing, no stat per entry
+        with os.scandir(ROOT_DATA_DIR) as it:
+            drone_names = [entry.name for entry in it if entry.is_dir()]
+    except OSError:
         return []
     
     active_drones = []
     current_time = time.time()
     
-    for drone_dir in ROOT_DATA_DIR.iterdir():
-        if drone_dir.is_dir():
-            drone_name = drone_dir.name
-            
-            # Load status for each drone
-            original_status = drone_status.copy()
-            load_status(drone_name)
-            
-            last_update = drone_status.get('last_update', 0)
-            is_active = (current_time - last_update) < 30.0  # Active within last 30 seconds
-            
-            if is_active:
-                active_drones.append({
-                    "name": drone_name,
-                    "position": drone_status.get('position', {"x": 0.0, "y": 0.0, "z": 0.0}),
-                    "flight_status": drone_status.get('flight_status', 'unknown'),
-                    "last_update": last_update,
-                    "time_since_update": current_time - last_update
-                })
-            
-            # Restore original status
-            drone_status.update(original_status)
+    for drone_name in drone_names:
+        load_status(drone_name)
+        status = get_drone_state(drone_name)
+        
+        last_update = status.get('last_update', 0)
+        is_active = (current_time - last_update) < 30.0  # Active within last 30 seconds
+        
+        if is_active:
+            active_drones.append({
+                "name": drone_name,
+                "position": status.get('position', {"x": 0.0, "y": 0.0, "z": 0.0}),
+                "flight_status": status.get('flight_status', 'unknown'),
+                "last_update": last_update,
+                "time_since_update": current_time - last_update
+            })
     
     return active_drones
 
@@ -455,37 +631,36 @@ def list_active_drones() -> List[Dict[str, Any]]:
 # COMMAND LINE INTERFACE
 # ========================================
 
+_COMMAND_TABLE = {
+    'takeoff': takeoff,
+    'land': land,
+    'hover': hover,
+    'move_relative': move_relative,
+    'emergency_stop': emergency_stop,
+    'get_drone_position': get_drone_position,
+    'get_drone_status': get_drone_status,
+    'get_visual_perception': get_visual_perception,
+    'get_collision_sensors': get_collision_sensors,
+    'set_altitude': set_altitude,
+    'check_drone_connection': check_drone_connection,
+    'get_crazyflie_capabilities': get_crazyflie_capabilities,
+    'list_active_drones': list_active_drones
+}
+
 def execute_command(command_name: str, *args) -> str:
     """Execute a command by name with arguments."""
-    commands = {
-        'takeoff': takeoff,
-        'land': land,
-        'hover': hover,
-        'move_relative': move_relative,
-        'emergency_stop': emergency_stop,
-        'get_drone_position': get_drone_position,
-        'get_drone_status': get_drone_status,
-        'get_visual_perception': get_visual_perception,
-        'get_collision_sensors': get_collision_sensors,
-        'set_altitude': set_altitude,
-        'check_drone_connection': check_drone_connection,
-        'get_crazyflie_capabilities': get_crazyflie_capabilities,
-        'list_active_drones': list_active_drones
-    }
-    
-    if command_name not in commands:
+    func = _COMMAND_TABLE.get(command_name)
+    if func is None:
         return f"❌ Unknown command: {command_name}"
     
     try:
-        func = commands[command_name]
         result = func(*args)
-        return str(result)
+        # Tools already return str; structured results are emitted as JSON
+        return result if isinstance(result, str) else _dumps(result)
     except Exception as e:
         return f"❌ Error executing {command_name}: {e}"
 
-def print_help():
-    """Print help information."""
-    print("""
+_HELP_TEXT = """
 🚁 Crazyflie MCP Server - Standalone Version
 
 Available Commands:
@@ -518,7 +693,11 @@ Examples:
   takeoff Crazyflie 1.5
   move_relative Crazyflie 1.0 0.0 0.5 0.0 3.0
   get_drone_status Crazyflie
-""")
+"""
+
+def print_help():
+    """Print help information."""
+    print(_HELP_TEXT)
 
 def initialize_server():
     """Initialize the standalone MCP server."""
@@ -528,6 +707,9 @@ def initialize_server():
     ROOT_DATA_DIR.mkdir(exist_ok=True)
     LOGS_DIR.mkdir(exist_ok=True)
     
+    # Readiness handshake: launchers wait for this file instead of sleeping
+    READY_FLAG.write_text(str(os.getpid()))
+    
     logger.info("✅ Crazyflie MCP Server initialized successfully")
     logger.info("📡 Server ready to accept drone control commands")
     logger.info("🛠️ 11 essential tools available for drone operations")
@@ -550,7 +732,7 @@ def file_monitoring_mode():
         with open(status_file, 'w') as f:
             json.dump(status_data, f, indent=2)
     except Exception as e:
-        logger.error(f"Failed to initialize status file: {e}")
+        logger.error("Failed to initialize status file: %s", e)
     
     last_command_time = 0
     
@@ -568,7 +750,7 @@ def file_monitoring_mode():
                         with open(commands_file, 'r') as f:
                             command_data = json.load(f)
                         
-                        logger.info(f"Received command: {command_data}")
+                        logger.info("Received command: %s", command_data)
                         
                         # Execute command
                         action = command_data.get('action')
@@ -611,7 +793,7 @@ def file_monitoring_mode():
                         else:
                             result = f"❌ Unknown action: {action}"
                         
-                        logger.info(f"Command result: {result}")
+                        logger.info("Command result: %s", result)
                         
                         # Update status with result
                         status_update = {
@@ -625,10 +807,10 @@ def file_monitoring_mode():
                             with open(status_file, 'w') as f:
                                 json.dump(status_update, f, indent=2)
                         except Exception as e:
-                            logger.error(f"Failed to update status file: {e}")
+                            logger.error("Failed to update status file: %s", e)
                         
                     except json.JSONDecodeError as e:
-                        logger.error(f"Invalid JSON in command file: {e}")
+                        logger.error("Invalid JSON in command file: %s", e)
                         status_update = {
                             "error": f"Invalid JSON: {e}",
                             "timestamp": time.time(),
@@ -641,7 +823,7 @@ def file_monitoring_mode():
                             pass
                             
                     except Exception as e:
-                        logger.error(f"Error processing command: {e}")
+                        logger.error("Error processing command: %s", e)
                         status_update = {
                             "error": str(e),
                             "timestamp": time.time(),
@@ -660,11 +842,16 @@ def file_monitoring_mode():
             logger.info("File monitoring stopped by user")
             break
         except Exception as e:
-            logger.error(f"Error in file monitoring: {e}")
+            logger.error("Error in file monitoring: %s", e)
             time.sleep(1)
 
+def _exit_on_sigterm(signum, frame):
+    """Turn SIGTERM (run.sh cleanup) into a normal exit so atexit flushes the log queue."""
+    sys.exit(128 + signum)
+
 def main():
     """Main entry point with mode detection."""
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
     initialize_server()
     
     # Check if running in interactive mode (has stdin) or file mode
@@ -675,6 +862,9 @@ def main():
         print("Type 'help' for commands or 'exit' to quit")
         print("=" * 50)
         
+        if readline is not None:
+            readline.set_history_length(1000)
+        
         while True:
             try:
                 user_input = input("\n> ").strip()
@@ -690,8 +880,8 @@ def main():
                     print_help()
                     continue
                 
-                # Parse command and arguments
-                parts = user_input.split()
+                # Parse command and arguments (quotes allow names with spaces)
+                parts = shlex.split(user_input)
                 command_name = parts[0]
                 args = parts[1:]
                 
@@ -151,7 +151,7 @@ cleanup() {
             kill $MCP_PID 2>/dev/null
             print_status "MCP Server stopped"
         fi
-        rm -f logs/mcp_server.pid
+        rm -f logs/mcp_server.pid data/ready.flag
     fi
     
     # Kill Webots
@@ -177,10 +177,16 @@ trap cleanup SIGINT SIGTERM
 # Start services based on mode
 if [[ "$MODE" == "server" ]] || [[ "$MODE" == "full" ]]; then
     print_status "Starting MCP Server..."
+    rm -f data/ready.flag
     python3 "$MCP_SERVER" > logs/mcp_server.log 2>&1 &
     MCP_PID=$!
     
-    sleep 2
+    # Wait for the server's readiness flag (up to 5 seconds)
+    for _ in $(seq 1 100); do
+        [[ -f "data/ready.flag" ]] && break
+        kill -0 $MCP_PID 2>/dev/null || break
+        sleep 0.05
+    done
     if kill -0 $MCP_PID 2>/dev/null; then
         echo $MCP_PID > logs/mcp_server.pid
         print_status "✅ MCP Server started (PID: $MCP_PID)"